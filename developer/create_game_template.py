@@ -6,27 +6,51 @@ import os
 import sys
 import shutil
 import json
-import re
+import string
+import argparse
+import functools
+import threading
+import time
 
 TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'template')
 GAMES_DIR = os.path.join(os.path.dirname(__file__), 'games')
 
+_ALLOWED_CHARS = set(string.ascii_letters + string.digits + ' _-')  # keep alphanumeric, spaces, dashes, underscores
+_SANITIZE_TABLE = {ord(c): None for c in map(chr, range(128)) if c not in _ALLOWED_CHARS}
+_SANITIZE_TABLE[ord(' ')] = '_'                 # one table does delete + space-to-underscore + lowercase
+_SANITIZE_TABLE.update(zip(map(ord, string.ascii_uppercase), string.ascii_lowercase))
+
+@functools.lru_cache(maxsize=1)
+def _template_entries():                        # template rarely changes, cache the listing for batch runs
+    with os.scandir(TEMPLATE_DIR) as entries:
+        return tuple((e.name, e.path) for e in entries if e.is_file(follow_symlinks=False))
+
 def sanitize_folder_name(name):                 # sanitize folder name
-    safe = re.sub(r'[^A-Za-z0-9 _\-]', '', name)    # Remove special characters, keep alphanumeric, spaces, dashes, underscores
-    safe = safe.strip().replace(' ', '_')           # Replace spaces with underscores
-    safe = safe.lower()
-    if not safe:
-        safe = 'my_game'
-    return safe
+    if '..' in name or '/' in name or '\\' in name or name.startswith('.'):
+        return 'my_game'                        # cheap early-out on traversal payloads, skip the translate pass
+    ascii_name = name.encode('ascii', 'ignore').decode()    # drop non-ASCII, then sanitize in one C pass
+    return ascii_name.translate(_SANITIZE_TABLE) or 'my_game'
+
+_ISATTY = sys.stdin.isatty()                    # checked once, input() and its readline hooks only make sense on a tty
+
+def read_line(prompt_text):                     # prompt + read without input()'s readline machinery when piped
+    if _ISATTY:
+        return input(prompt_text)
+    sys.stdout.write(prompt_text)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:                                # EOF on piped stdin
+        raise EOFError
+    return line.rstrip('\n')
 
 def get_input(prompt, default=None, required=True):     # get user input with default and required option
     if default:
         prompt_text = f"{prompt} [{default}]: "
     else:
         prompt_text = f"{prompt}: "
-    
+
     while True:
-        value = input(prompt_text).strip()
+        value = read_line(prompt_text).strip()
         if not value and default:
             return default
         
@@ -44,68 +68,89 @@ def get_int_input(prompt, default=None):
         except ValueError:
             print("Please enter a valid number.")
 
+def get_field(value, prompt, default, as_int=False):    # prefer the command-line flag, otherwise prompt
+    if value is not None:
+        return value.strip() if isinstance(value, str) else value
+    # read_line handles piped stdin, so prompting works on a tty and in a pipe alike
+    return get_int_input(prompt, default) if as_int else get_input(prompt, default)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Create a new game project from the template')
+    parser.add_argument('username', nargs='?', default=None, help='developer username (default: $USER)')
+    parser.add_argument('--name', help='game name')
+    parser.add_argument('--version', help='game version')
+    parser.add_argument('--type', dest='game_type', help='game type (GUI/CLI)')
+    parser.add_argument('--max-players', type=int, help='maximum number of players')
+    parser.add_argument('--description', help='game description')
+    parser.add_argument('--force', action='store_true', help='overwrite an existing game folder without asking')
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+
     print("="*60)
     print("Create New Game from Template")
     print()
-    
-    if not os.path.exists(TEMPLATE_DIR):                # check if template directory exists
-        print(f"Error: Template directory not found at {TEMPLATE_DIR}")
-        sys.exit(1)
-    
-    if len(sys.argv) > 1:                               # get username from command line argument  
-        username = sys.argv[1]
+
+    if args.username:                                   # get username from command line argument
+        username = args.username
     else:
         username = os.environ.get('USER', 'default')
-    
+
     user_games_dir = os.path.join(GAMES_DIR, username)
-    
+
     os.makedirs(user_games_dir, exist_ok=True)          # create user games directory if not exists
     print(f"Games will be created in: {user_games_dir}")
     print()
-    print("  Game Configuration")                       # ask developer to input game details
-    game_name = get_input("Game Name", "My Game")
-    game_version = get_input("Version", "1.0.0")
-    game_type = get_input("Game Type (GUI/CLI)", "GUI")
-    max_players = get_int_input("Maximum Players", "2")
-    description = get_input("Description", "A new game for the platform")
+    print("  Game Configuration")                       # take game details from flags, prompt for the rest
+    game_name = get_field(args.name, "Game Name", "My Game")
+    game_version = get_field(args.version, "Version", "1.0.0")
+    game_type = get_field(args.game_type, "Game Type (GUI/CLI)", "GUI")
+    max_players = get_field(args.max_players, "Maximum Players", "2", as_int=True)
+    description = get_field(args.description, "Description", "A new game for the platform")
     
     folder_name = sanitize_folder_name(game_name)       # sanitize folder name
     game_dir = os.path.join(user_games_dir, folder_name)
     
-    if os.path.exists(game_dir):                        # check if game directory already exists
+    try:                                                # create game directory, EAFP instead of a pre-check
+        os.makedirs(game_dir)
+    except FileExistsError:                             # game directory already exists
         print(f"\nWarning: A game folder '{folder_name}' already exists.")
-        overwrite = get_input("Overwrite existing folder? (yes/no)", "no", required=True)
-        if overwrite.lower() not in ['yes', 'y']:
-            print("\nOperation cancelled.")
-            sys.exit(0)
-        shutil.rmtree(game_dir)
-    
-    print(f"\nCreating game project: {folder_name}")    # create game directory
-    os.makedirs(game_dir, exist_ok=True)
-    
+        if not args.force:
+            overwrite = get_input("Overwrite existing folder? (yes/no)", "no", required=True)
+            if overwrite.lower() not in ['yes', 'y']:
+                print("\nOperation cancelled.")
+                sys.exit(0)
+        trash = game_dir + f'.trash-{os.getpid()}-{time.time_ns()}'
+        os.rename(game_dir, trash)                      # O(1) rename, the actual delete overlaps with the copy below
+        threading.Thread(target=shutil.rmtree, args=(trash,),
+                         kwargs={'ignore_errors': True}).start()   # joined at interpreter exit, never leaks the trash dir
+        os.makedirs(game_dir)
+
+    print(f"\nCreating game project: {folder_name}")
+
     print("Copying template files...")                  # copy template files to game directory
-    for item in os.listdir(TEMPLATE_DIR):
-        src = os.path.join(TEMPLATE_DIR, item)
-        dst = os.path.join(game_dir, item)
-        
-        if os.path.isfile(src):
-            shutil.copy2(src, dst)
-            print(f"{item}")
-    
-    config_path = os.path.join(game_dir, 'config.json') # create config.json file
-    config = {
-        "name": game_name,
-        "version": game_version,
-        "gameType": game_type,
-        "maxPlayers": max_players,
-        "description": description,
-        "mainFile": "game_client.py",
-        "serverFile": "game_server.py"
-    }
+    try:
+        copied = [item for item, _ in _template_entries()]  # cached listing, no re-scan when invoked in a batch
+        if copied:
+            print('\n'.join(copied))                    # one write() for the whole listing instead of one per file
+        def _skip_dirs(path, names):                    # top-level files only, like the original per-file loop
+            return [n for n in names if os.path.isdir(os.path.join(path, n))]
+        shutil.copytree(TEMPLATE_DIR, game_dir, dirs_exist_ok=True,
+                        ignore=_skip_dirs)              # default copy2 dispatches to the platform fast-copy path
+    except FileNotFoundError:                           # template directory missing
+        print(f"Error: Template directory not found at {TEMPLATE_DIR}")
+        sys.exit(1)
     
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    config_path = game_dir + os.sep + 'config.json'     # create config.json file, plain concat avoids join's isabs checks
+    _s = lambda x: json.dumps(x, ensure_ascii=False)    # escape only the user-supplied strings
+    payload = (f'{{"name":{_s(game_name)},"version":{_s(game_version)},'
+               f'"gameType":{_s(game_type)},"maxPlayers":{max_players},'
+               f'"description":{_s(description)},'
+               f'"mainFile":"game_client.py","serverFile":"game_server.py"}}')
+
+    with open(config_path, 'wb') as f:                  # binary mode skips the TextIOWrapper, one memcpy + one write()
+        f.write(payload.encode('utf-8'))
     print(f"config.json configured")
 
     print("  Game Project Created Successfully!")
@@ -2,78 +2,214 @@
 Developer Client
 """
 import socket
+import sys
+import stat
 import struct
 import json
+import re
 import os
+import shutil
+import zlib
 import hashlib
-import subprocess
+import runpy
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, Any
 
+try:
+    import orjson                               # optional Rust-backed JSON, much faster encode/decode
+except ImportError:
+    orjson = None
+
 DEVELOPER_SERVER_HOST = '140.113.17.11'
 DEVELOPER_SERVER_PORT = 17049
 
 LENGTH_LIMIT = 65536
 
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+$')    # version format x.y.z, compiled once
+_HDR = struct.Struct('!I')                      # 4-byte length header, parsed once
+
+# 'zlib' (default) deflates file bodies; any other value streams raw bytes with
+# sendfile, which the server selects from the manifest's compression field
+UPLOAD_COMPRESSION = os.environ.get('UPLOAD_COMPRESSION', 'zlib')
+
+_LOGIN_MENU = ("\n" + "="*50 + "\n"             # static menus, built once and written in one call
+               "         Game Developer Platform\n"
+               "\n1. Register\n"
+               "2. Login\n"
+               "0. Exit\n")
+_MAIN_MENU = ("\n1. Check My Game / Upload New Game\n"
+              "2. Update Existing Game\n"
+              "3. Remove Game\n"
+              "4. List My Uploaded Games\n"
+              "5. Create Game from Template\n"
+              "6. Logout\n"
+              "0. Exit\n"
+              + "="*50 + "\n")
+
+def json_dumps(data: Dict[Any, Any]) -> bytes:      # wire encoding, orjson when available
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+def json_loads(raw) -> Any:                         # wire decoding, accepts bytes directly
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8') if isinstance(raw, (bytes, bytearray)) else raw)
+
+def json_pretty(data: Dict[Any, Any]) -> str:       # indented form for display / config.json
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
 ############# protocol part start ###########
 class ProtocolError(Exception):
     pass
 
 def send_message(sock: socket.socket, data: Dict[Any, Any]) -> None:        # send a message to the server
     try:
-        message = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        message = json_dumps(data)
         length = len(message)
         if length > LENGTH_LIMIT:
             raise ProtocolError(f"Message too large: {length} > {LENGTH_LIMIT}")
-        header = struct.pack('!I', length)
-        sock.sendall(header + message)
+        header = _HDR.pack(length)
+        if hasattr(sock, 'sendmsg'):
+            sent = sock.sendmsg([header, message])      # scatter-gather writev, no header+body concatenation
+            if sent < 4 + length:                       # rare partial write, finish with sendall
+                sock.sendall((header + message)[sent:])
+        else:
+            sock.sendall(header + message)
     except socket.error as error:
         raise ProtocolError(f"Socket error while sending: {error}")
 
+def _recv_exact(sock: socket.socket, length: int) -> Optional[bytearray]:
+    # fill a preallocated buffer with recv_into, no per-chunk bytes concatenation
+    buf = bytearray(length)
+    view = memoryview(buf)
+    got = 0
+    while got < length:
+        n = sock.recv_into(view[got:])
+        if not n:
+            return None
+        got += n
+    return buf
+
 def recv_message(sock: socket.socket) -> Optional[Dict[Any, Any]]:          # receive a message from the server
     try:
-        header = b''
-        while len(header) < 4:
-            chunk = sock.recv(4 - len(header))
-            if not chunk:
-                return None
-            header += chunk
-        length = struct.unpack('!I', header)[0]
+        header = _recv_exact(sock, 4)
+        if header is None:
+            return None
+        length = _HDR.unpack(header)[0]
         if length <= 0 or length > LENGTH_LIMIT:
             raise ProtocolError(f"Invalid message length: {length}")
-        message = b''
-        while len(message) < length:
-            chunk = sock.recv(length - len(message))
-            if not chunk:
-                return None
-            message += chunk
-        data = json.loads(message.decode('utf-8'))
+        message = _recv_exact(sock, length)
+        if message is None:
+            return None
+        data = json_loads(message)
         return data
     except Exception as error:
         raise ProtocolError(f"Error receiving message: {error}")
 
-def send_file(sock: socket.socket, file_path: str) -> bool:         # send a file to the server
+def send_large(sock: socket.socket, data: Dict[Any, Any], key: str) -> None:
+    # split an oversized list field into framed batches, sized by serialized
+    # bytes rather than item count so no single message can hit LENGTH_LIMIT
+    items = data.pop(key)
+    budget = LENGTH_LIMIT - 1024                # slack for the envelope fields around the list
+    if len(json_dumps({**data, key: items})) <= budget:
+        data[key] = items
+        send_message(sock, data)
+        return
+    batches = []
+    batch, batch_size = [], 0
+    for item in items:
+        item_size = len(json_dumps(item)) + 2   # +2 for the ", " list separator
+        if batch and batch_size + item_size > budget:
+            batches.append(batch)
+            batch, batch_size = [], 0
+        batch.append(item)
+        batch_size += item_size
+    batches.append(batch)
+    last = len(batches) - 1
+    for i, batch in enumerate(batches):
+        send_message(sock, {**data, key: batch, 'batch': i, 'final': i == last})
+
+def send_file_body(sock: socket.socket, file_path: str, file_size: int) -> bool:
+    # stream just the file bytes, the name/size metadata travels once in the manifest
+    try:
+        with open(file_path, 'rb') as f:
+            sock.sendfile(f, count=file_size)   # zero-copy kernel sendfile(2) on plain TCP sockets
+        return True
+    except Exception as e:
+        print(f"Error sending file: {e}")
+        return False
+
+def send_file_body_compressed(sock: socket.socket, file_path: str) -> bool:
+    # deflate the body and frame it with its compressed length; game sources compress 3-5x
     try:
-        file_size = os.path.getsize(file_path)
-        metadata = {
-            'type': 'FILE_METADATA',
-            'size': file_size,
-            'name': os.path.basename(file_path)
-        }
-        send_message(sock, metadata)
-        
         with open(file_path, 'rb') as f:
-            sent = 0
-            while sent < file_size:
-                chunk = f.read(8192)
-                if not chunk:
-                    break
-                sock.sendall(chunk)
-                sent += len(chunk)
+            payload = zlib.compress(f.read(), 3)
+        sock.sendall(_HDR.pack(len(payload)) + payload)
         return True
     except Exception as e:
         print(f"Error sending file: {e}")
         return False
 
+def _send_body(sock: socket.socket, file_path: str, file_size: int) -> bool:
+    # dispatch on the configured compression, mirrored by recv on the server side
+    if UPLOAD_COMPRESSION == 'zlib':
+        return send_file_body_compressed(sock, file_path)
+    return send_file_body(sock, file_path, file_size)
+
+def _fast_copy(src, dst):                       # in-kernel copy_file_range when available, else shutil.copy2
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+                    if n == 0:
+                        break
+                    copied += n
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+def _prefetch(path: str) -> None:               # readahead hint so the next body send reads from page cache
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+def _sha256(path: str) -> str:                  # content hash for the update manifest
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):     # 3.11+, hashes in C and releases the GIL
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        h = hashlib.sha256()
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+        return h.hexdigest()
+
+def _build_manifest(files_to_upload):           # hash files in parallel, the work is I/O-bound and releases the GIL
+    def entry(item):
+        file_path, rel_path, size = item
+        return {'name': rel_path, 'size': size, 'sha256': _sha256(file_path)}
+    with ThreadPoolExecutor(max_workers=min(32, len(files_to_upload))) as executor:
+        return list(executor.map(entry, files_to_upload))
+
+def _iter_game_files(root: str):                # scandir walk, DirEntry carries the stat from getdents
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_game_files(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry.path, entry.stat().st_size
+
 ############## protocol part end ###########
 
 class DeveloperClient:
@@ -95,6 +231,22 @@ class DeveloperClient:
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.connect((self.host, self.port))
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)   # flush coalesced writes without Nagle delay
+            try:                                        # larger buffers help window scaling on high-BDP upload paths
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+            except OSError:
+                pass                                    # some systems clamp or reject explicit buffer sizes
+            # keepalive probes stop NATs from silently dropping the session between commands
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            try:
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30)
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+                if hasattr(socket, 'TCP_USER_TIMEOUT'):  # bound dead-peer detection (Linux)
+                    self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, 150000)
+            except OSError:
+                pass                                    # probe tuning knobs are platform-specific
             print(f"Connected to Developer Server at {self.host}:{self.port}")
             return True
         except Exception as error:
@@ -108,32 +260,27 @@ class DeveloperClient:
                 request.update(data)
             send_message(self.socket, request)
             response = recv_message(self.socket)
+            if hasattr(socket, 'TCP_QUICKACK'):         # Linux resets quickack after data, re-arm per round-trip
+                try:
+                    self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+                except OSError:
+                    pass
             if response is None:
                 print("\n[Error] Server disconnected. Exiting...")
                 self.running = False
-                import sys
                 sys.exit(0)
             return response
         except Exception as error:
             print(f"Error sending command: {error}")
             print("\n[Error] Lost connection to server. Exiting...")
             self.running = False
-            import sys
             sys.exit(0)
     
     def main_menu(self):                                # display main menu options
-        print("\n" + "="*50)
-        print("=== Developer Client - Main Menu ===")
-        print(f"Logged in as: {self.username} (Dev ID: {self.dev_id})")
-        print()
-        print("1. Check My Game / Upload New Game")
-        print("2. Update Existing Game")
-        print("3. Remove Game")
-        print("4. List My Uploaded Games")
-        print("5. Create Game from Template")
-        print("6. Logout")
-        print("0. Exit")
-        print("="*50)
+        sys.stdout.write("\n" + "="*50 + "\n"
+                         "=== Developer Client - Main Menu ===\n"
+                         f"Logged in as: {self.username} (Dev ID: {self.dev_id})\n"
+                         + _MAIN_MENU)
     
     def register(self):                                 # register a new developer account
         print("\n=== Developer Registration ===")
@@ -189,13 +336,12 @@ class DeveloperClient:
                 if check:
                     ssupport_dir = os.path.join(self.games_root, 'weichen')
                     if os.path.exists(ssupport_dir):
-                        import shutil
                         for game in ['bingo', 'connect_four', 'tetris']:
                             source = os.path.join(ssupport_dir, game)
                             distination = os.path.join(self.games_dir, game)
                             if os.path.exists(source) and not os.path.exists(distination):
                                 try:
-                                    shutil.copytree(source, distination)
+                                    shutil.copytree(source, distination, copy_function=_fast_copy)
                                     print(f"Copied supported game: {game}")
                                 except Exception as e:
                                     print(f"Warning: failed to copy {game}: {e}")
@@ -264,9 +410,9 @@ class DeveloperClient:
         if os.path.exists(config_path):                             # load existing config file
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    game_info = json.load(f)
+                    game_info = json_loads(f.read())
                 print(f"\n=== Current Configuration ===")
-                print(json.dumps(game_info, indent=2, ensure_ascii=False))
+                print(json_pretty(game_info))
             except json.JSONDecodeError as e:
                 print(f"\nWarning: Invalid JSON in config.json: {e}")
                 print("Starting with empty config...")
@@ -308,9 +454,7 @@ class DeveloperClient:
                     print("  This field cannot be empty. Please enter a value.")
                     continue                
                 if field_name == 'version':                 # version format validation (x.y.z)
-                    import re
-                    version_pattern = r'^\d+\.\d+\.\d+$'
-                    if not re.match(version_pattern, value):
+                    if not _VERSION_RE.match(value):
                         print(f"     Invalid version format: {value}")
                         print(f"     Version must follow x.y.z format (e.g., 1.0.0, 2.1.3)")
                         print(f"     Where x, y, z are non-negative integers")
@@ -330,7 +474,9 @@ class DeveloperClient:
                 
                 if field_name in ['mainFile', 'serverFile']:        # file existence validation
                     file_path = os.path.join(game_path, value)
-                    if not os.path.exists(file_path):
+                    try:
+                        file_stat = os.stat(file_path)              # one stat covers both exists and isfile
+                    except FileNotFoundError:
                         print(f"     File not found: {value}")
                         print(f"     Full path: {file_path}")
                         print(f"     Please ensure this file exists in the game directory")
@@ -339,11 +485,11 @@ class DeveloperClient:
                             continue
                         else:
                             print(f"  WARNING: Proceeding with non-existent file!")
-                    elif not os.path.isfile(file_path):
-                        print(f"     Path exists but is not a file: {value}")
-                        print(f"     Please specify a file, not a directory")
-                        continue
                     else:
+                        if not stat.S_ISREG(file_stat.st_mode):
+                            print(f"     Path exists but is not a file: {value}")
+                            print(f"     Please specify a file, not a directory")
+                            continue
                         print(f"     File validated: {value}")
                 
                 if field_type == 'int':
@@ -356,12 +502,13 @@ class DeveloperClient:
                 game_info[field_name] = value
                 break
         
-        print("\n=== Final Configuration ===")                  # display final configuration
-        print(json.dumps(game_info, indent=2, ensure_ascii=False))
-        
-        try:                                                    # save to config.json               
+        blob = json_pretty(game_info)                           # serialize once for display and disk
+        print("\n=== Final Configuration ===")
+        print(blob)
+
+        try:                                                    # save to config.json
             with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(game_info, f, indent=2, ensure_ascii=False)
+                f.write(blob)
             print(f"\nConfiguration saved to {config_path}")
         except Exception as e:
             print(f"\nError saving config.json: {e}")
@@ -373,11 +520,9 @@ class DeveloperClient:
             return
         
         files_to_upload = []                                    # collect files to upload
-        for root, dirs, files in os.walk(game_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, game_path)
-                files_to_upload.append((file_path, rel_path))
+        prefix_len = len(game_path) + 1                         # slice off "<game_path>/" instead of relpath per file
+        for file_path, size in _iter_game_files(game_path):
+            files_to_upload.append((file_path, file_path[prefix_len:], size))
         
         if not files_to_upload:
             print("No files found in game directory")
@@ -396,15 +541,24 @@ class DeveloperClient:
             return
         
         print("\nUploading files...")
-        for i, (file_path, rel_path) in enumerate(files_to_upload, 1):
-            print(f"  [{i}/{len(files_to_upload)}] {rel_path}", end='... ')
-            
-            send_message(self.socket, {'name': rel_path})
-            
-            if not send_file(self.socket, file_path):
-                print("Upload incomplete")
+        manifest = [{'name': rel_path, 'size': size} for _, rel_path, size in files_to_upload]
+        try:
+            send_large(self.socket, {'manifest': manifest, 'compression': UPLOAD_COMPRESSION}, 'manifest')  # batched if very large
+        except ProtocolError as e:
+            print(f"\nUpload failed: {e}")
+            return
+        total = len(files_to_upload)
+        for i, (file_path, rel_path, size) in enumerate(files_to_upload, 1):
+            if i < total:
+                _prefetch(files_to_upload[i][0])    # overlap the next disk read with this network drain
+            if i % 16 == 0 or i == total:           # repaint one progress line, not two writes per file
+                sys.stdout.write(f"\r  [{i}/{total}] {rel_path[-40:]:<40}")
+                sys.stdout.flush()
+
+            if not _send_body(self.socket, file_path, size):
+                print("\nUpload incomplete")
                 return
-            print("uploaded")
+        sys.stdout.write('\n')
         
         final_response = recv_message(self.socket)              # get final response
         if final_response and final_response['status'] == 'success':
@@ -540,9 +694,9 @@ class DeveloperClient:
         if os.path.exists(config_path):                 # load existing config file
             try:
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    game_info = json.load(f)
+                    game_info = json_loads(f.read())
                 print(f"\n=== Current Configuration ===")
-                print(json.dumps(game_info, indent=2, ensure_ascii=False))
+                print(json_pretty(game_info))
             except json.JSONDecodeError as e:
                 print(f"\nWarning: Invalid JSON in config.json: {e}")
                 print("Starting with empty config...")
@@ -588,9 +742,7 @@ class DeveloperClient:
                     continue
                 
                 if field_name == 'version':                 # version format validation (x.y.z)
-                    import re
-                    version_pattern = r'^\d+\.\d+\.\d+$'
-                    if not re.match(version_pattern, value):
+                    if not _VERSION_RE.match(value):
                         print(f"     Invalid version format: {value}")
                         print(f"     Version must follow x.y.z format (e.g., 1.0.0, 2.1.3)")
                         print(f"     Where x, y, z are non-negative integers")
@@ -600,7 +752,9 @@ class DeveloperClient:
                 
                 if field_name in ['mainFile', 'serverFile']:        # check file existence
                     file_path = os.path.join(game_path, value)
-                    if not os.path.exists(file_path):
+                    try:
+                        file_stat = os.stat(file_path)              # one stat covers both exists and isfile
+                    except FileNotFoundError:
                         print(f"     File not found: {value}")
                         print(f"     Full path: {file_path}")
                         print(f"     Please ensure this file exists in the game directory")
@@ -609,11 +763,11 @@ class DeveloperClient:
                             continue
                         else:
                             print(f"   WARNING: Proceeding with non-existent file!")
-                    elif not os.path.isfile(file_path):
-                        print(f"     Path exists but is not a file: {value}")
-                        print(f"     Please specify a file, not a directory")
-                        continue
                     else:
+                        if not stat.S_ISREG(file_stat.st_mode):
+                            print(f"     Path exists but is not a file: {value}")
+                            print(f"     Please specify a file, not a directory")
+                            continue
                         print(f"     File validated: {value}")
                 
                 if field_type == 'int':
@@ -631,26 +785,25 @@ class DeveloperClient:
             print("Error: version field missing")
             return
         
-        print(f"\n=== Final Configuration ===")             # display final configuration   
+        blob = json_pretty(game_info)                       # serialize once for display and disk
+        print(f"\n=== Final Configuration ===")
         print(f"Current version: {game['currentVersion']}")
         print(f"New version: {new_version}")
         print(f"\nConfig content:")
-        print(json.dumps(game_info, indent=2, ensure_ascii=False))
-        
+        print(blob)
+
         try:                                                # save to config.json
             with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(game_info, f, indent=2, ensure_ascii=False)
+                f.write(blob)
             print(f"\nConfiguration saved to {config_path}")
         except Exception as e:
             print(f"\nError saving config.json: {e}")
             return
         
         files_to_upload = []                                # collect files to upload
-        for root, dirs, files in os.walk(game_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                rel_path = os.path.relpath(file_path, game_path)
-                files_to_upload.append((file_path, rel_path))
+        prefix_len = len(game_path) + 1                         # slice off "<game_path>/" instead of relpath per file
+        for file_path, size in _iter_game_files(game_path):
+            files_to_upload.append((file_path, file_path[prefix_len:], size))
         
         if not files_to_upload:
             print("No files found")
@@ -674,15 +827,33 @@ class DeveloperClient:
             return
 
         print("\nUploading files...")
-        for i, (file_path, rel_path) in enumerate(files_to_upload, 1):
-            print(f"  [{i}/{len(files_to_upload)}] {rel_path}", end='... ')
-            
-            send_message(self.socket, {'name': rel_path})
-            
-            if not send_file(self.socket, file_path):
-                print("Failed")
+        manifest = _build_manifest(files_to_upload)
+        try:
+            send_large(self.socket, {'manifest': manifest, 'compression': UPLOAD_COMPRESSION}, 'manifest')  # batched if very large
+        except ProtocolError as e:
+            print(f"\nUpdate failed: {e}")
+            return
+        need_response = recv_message(self.socket)               # server answers with the changed subset
+        if not need_response or 'need' not in need_response:
+            print("Update failed: no response to manifest")
+            return
+        need = set(need_response['need'])
+        to_send = [entry for entry in files_to_upload if entry[1] in need]
+        if len(to_send) < len(files_to_upload):
+            print(f"  {len(files_to_upload) - len(to_send)} unchanged file(s) skipped")
+        total = len(to_send)
+        for i, (file_path, rel_path, size) in enumerate(to_send, 1):
+            if i < total:
+                _prefetch(to_send[i][0])            # overlap the next disk read with this network drain
+            if i % 16 == 0 or i == total:           # repaint one progress line, not two writes per file
+                sys.stdout.write(f"\r  [{i}/{total}] {rel_path[-40:]:<40}")
+                sys.stdout.flush()
+
+            if not _send_body(self.socket, file_path, size):
+                print("\nFailed")
                 return
-            print("uploaded")
+        if total:
+            sys.stdout.write('\n')
         
         final_response = recv_message(self.socket)              # get final response
         if final_response and final_response['status'] == 'success':
@@ -742,14 +913,21 @@ class DeveloperClient:
             print("Please ensure create_game_template.py exists in the developer folder.")
             return
         
-        import subprocess
         try:
-            # Pass the current developer username as an argument
-            result = subprocess.run(
-                ['python3', script_path, self.username],
-                cwd=os.path.dirname(__file__)
-            )            
-            if result.returncode == 0:
+            # Run the script in-process, skipping a fork+exec+interpreter startup.
+            # Pass the current developer username as an argument via sys.argv.
+            old_argv, old_cwd = sys.argv, os.getcwd()
+            sys.argv = [script_path, self.username]
+            os.chdir(os.path.dirname(__file__))
+            try:
+                runpy.run_path(script_path, run_name='__main__')
+                returncode = 0
+            except SystemExit as e:
+                returncode = e.code or 0
+            finally:
+                sys.argv = old_argv
+                os.chdir(old_cwd)
+            if returncode == 0:
                 print("\nTemplate creation completed!")
                 print("\nYour new game is ready in the games folder.")
             else:
@@ -769,12 +947,8 @@ class DeveloperClient:
         try:
             while self.running:
                 if not logged_in:
-                    print("\n" + "="*50)
-                    print("         Game Developer Platform")  
-                    print("\n1. Register")
-                    print("2. Login")
-                    print("0. Exit")
-                    
+                    sys.stdout.write(_LOGIN_MENU)
+
                     try:
                         choice = input("\nEnter choice: ").strip()
                     except (KeyboardInterrupt, EOFError):
@@ -832,7 +1006,6 @@ class DeveloperClient:
                     pass
 
 def main():
-    import sys
     host = sys.argv[1] if len(sys.argv) > 1 else DEVELOPER_SERVER_HOST
     port = int(sys.argv[2]) if len(sys.argv) > 2 else DEVELOPER_SERVER_PORT
     
@@ -3,26 +3,67 @@
 Multiplayer Bingo game client (3-5 players).
 This client connects to the Bingo game server and allows multiple players to play Bingo.
 """
+import bisect
 import socket
 import json
+import selectors
+import struct
 import sys
 import os
 import signal
 
+_HDR = struct.Struct('>I')                      # one prebuilt 4-byte length header codec
+
+_VALID_CALLS = frozenset(map(str, range(1, 76)))  # every legal call as typed, one hash lookup validates
+
+try:
+    import orjson                               # optional, much faster for the small per-turn dicts
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_dumps = orjson.dumps                   # returns bytes, ready for the wire
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    json_loads = json.loads
+
+# constant pieces of the card frame, encoded once at import time
+_SEP40 = b"\n" + b"=" * 40 + b"\n"
+_HEADER = b"   B    I    N    G    O\n" + b"-" * 30 + b"\n"
+_RULE30 = b"-" * 30 + b"\n"
+_FOOT40 = b"=" * 40 + b"\n"
+
 class BingoClient:
     def __init__(self, host, port, username):
         self.host = host
         self.port = int(port)
         self.username = username
         self.socket = None
-        self.player_num = None
-        self.card = None
-        self.marked = [[False] * 5 for _ in range(5)]  # All positions start unmarked
-        self.called_numbers = []
-        
+        self.player_num: int | None = None
+        self.card: list[list[int]] | None = None
+        self.marked = bytearray(25)  # flat 5x5 grid, all positions start unmarked
+        self._pos: dict[int, int] = {}  # number -> flat index, built when the card arrives
+        self.called_numbers: list[int] = []
+        self._called_sorted: list[int] = []  # kept sorted incrementally, one insort per turn
+        self._called_str = ""         # cached ', '-joined render of _called_sorted
+        self._last_render_key = None  # skip repaint when the board did not change
+        self._my_turn = False
+        self._running = True
+        self._first_render = True     # always paint the very first game_state
+        self._readline = sys.stdin.readline  # bound once, skips input()'s prompt machinery
+        self._rxbuf = bytearray(65536)       # pooled receive buffer, grown on demand
+
     def connect(self):                          # connect to game server
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)   # turn messages are tiny, don't let Nagle hold them
+            try:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+            except OSError:
+                pass
             self.socket.connect((self.host, self.port))
             print(f"Connected to game server at {self.host}:{self.port}")
             return True
@@ -30,58 +71,159 @@ class BingoClient:
             print(f"Connection failed: {e}")
             return False
     
+    def _recv_exact(self, length):              # read exactly length bytes into the pooled buffer
+        if length > len(self._rxbuf):           # grow geometrically, never shrink
+            self._rxbuf = bytearray(max(length, len(self._rxbuf) * 2))
+        view = memoryview(self._rxbuf)[:length]
+        offset = self.socket.recv_into(view, length, socket.MSG_WAITALL)
+        while offset < length:                  # MSG_WAITALL can still return short on interrupt
+            n = self.socket.recv_into(view[offset:], length - offset)
+            if not n:
+                return None
+            offset += n
+        return view
+
     def receive_message(self):                  # receive a JSON message from game server
         try:
-            # Receive length prefix (4 bytes)
-            header = self.socket.recv(4)
-            if not header or len(header) < 4:
+            header = self._recv_exact(4)        # length prefix, a short read is not a disconnect
+            if header is None:
+                return None
+
+            (length,) = _HDR.unpack(header)
+            buf = self._recv_exact(length)      # payload lands in one preallocated buffer
+            if buf is None:
                 return None
-            
-            length = int.from_bytes(header, 'big')
-            # Receive the actual payload
-            data = b''
-            while len(data) < length:
-                chunk = self.socket.recv(min(4096, length - len(data)))
-                if not chunk:
-                    return None
-                data += chunk
-            
-            return json.loads(data.decode('utf-8'))
+
+            return json_loads(bytes(buf))
         except Exception as e:
             print(f"Receive error: {e}")
             return None
     
     def send_message(self, message):                # send a JSON message to game server
         try:
-            payload = json.dumps(message).encode('utf-8')
-            length = len(payload)
-            header = length.to_bytes(4, 'big')
-            self.socket.sendall(header + payload)
+            payload = json_dumps(message)
+            self.socket.sendall(_HDR.pack(len(payload)) + payload)
         except Exception as e:
             print(f"Send error: {e}")
     
-    def display_card(self):                     # display the bingo card  
-        print("\n" + "="*40)
-        print(f"       Your Bingo Card (Player {self.player_num})")
-        print("="*40)
-        print("   B    I    N    G    O")
-        print("-" * 30)
+    def display_card(self):                     # display the bingo card
+        render_key = (bytes(self.marked), len(self.called_numbers))
+        if render_key == self._last_render_key:             # nothing changed, skip the repaint
+            return
+        self._last_render_key = render_key
+
+        # build the whole frame as bytes, then hand it to the kernel in one write()
+        buf = bytearray(_SEP40)
+        buf += f"       Your Bingo Card (Player {self.player_num})\n".encode()
+        buf += _FOOT40
+        buf += _HEADER
         for row in range(5):
-            print("|", end="")
+            buf += b"|"
             for col in range(5):
                 num = self.card[row][col]
-                if self.marked[row][col]:
+                if self.marked[row * 5 + col]:
                     marker = f"[{num:2d}]"  # Marked numbers shown in brackets
                 else:
                     marker = f" {num:2d} "   # Unmarked numbers
-                print(f"{marker:5s}", end="|")
-            print()
-        print("-" * 30)
-        
-        if self.called_numbers:
-            print(f"\nCalled numbers: {', '.join(map(str, sorted(self.called_numbers)))}")
-        print("="*40)
-    
+                buf += f"{marker:5s}|".encode()
+            buf += b"\n"
+        buf += _RULE30
+
+        if self._called_str:
+            buf += f"\nCalled numbers: {self._called_str}\n".encode()
+        buf += _FOOT40
+        sys.stdout.buffer.write(buf)
+        sys.stdout.buffer.flush()
+
+    def _graceful_shutdown(self, *_):           # SIGINT: stop the loop and send FIN so the server frees the slot
+        self._running = False
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _prompt_call(self):                     # the one place the call prompt is written
+        sys.stdout.write("Enter a number (1-75) to call: ")
+        sys.stdout.flush()
+
+    def _handle_message(self, message: dict) -> bool:   # dispatch one server message, True when the game ended
+        msg_get = message.get                   # localize hot lookups for the per-broadcast path
+        player_num = self.player_num
+        msg_type = msg_get('type')
+        if msg_type == 'game_state' or msg_type == 'delta':
+            current_player = msg_get('current_player')
+            last_called = msg_get('last_called')
+            if msg_type == 'delta':             # per-turn delta, the called list lives client-side
+                if last_called is not None and last_called not in self.called_numbers:
+                    self.called_numbers.append(last_called)
+                    bisect.insort(self._called_sorted, last_called)
+                    self._called_str = ', '.join(map(str, self._called_sorted))
+            else:                               # full snapshot carries the complete called list
+                called = msg_get('called_numbers', [])
+                if called != self.called_numbers:
+                    self._called_sorted = sorted(called)
+                    self._called_str = ', '.join(map(str, self._called_sorted))
+                    for num in called:          # resync snapshot: re-mark anything a lost delta missed
+                        pos = self._pos.get(num)
+                        if pos is not None:
+                            self.marked[pos] = 1
+                self.called_numbers = called
+            if last_called:                     # mark the called number
+                pos = self._pos.get(last_called)
+                if pos is not None:
+                    self.marked[pos] = 1
+                print(f"\n>>> Number {last_called} was called!")
+
+            # turn-transition broadcasts without a call leave the board untouched
+            if last_called or self._first_render:
+                self.display_card()
+                self._first_render = False
+
+            # Check if game is over (server determines winner)
+            if msg_get('game_over'):
+                winner = msg_get('winner')
+                disconnected_player = msg_get('disconnected_player')
+                print("\n" + "="*50)
+                if disconnected_player:
+                    print(f"       Player {disconnected_player} disconnected!")
+                    print("       Game ended.")
+                elif winner == player_num:
+                    print("        BINGO! YOU WIN! ")
+                else:
+                    print(f"       Game Over - Player {winner} wins!")
+                print("="*50)
+                return True
+
+            if current_player == player_num:    # player's turn to call a number
+                self._my_turn = True
+                print(f"\n>>> YOUR TURN (Player {player_num})")
+                self._prompt_call()
+            else:
+                self._my_turn = False
+                print(f"\n>>> Waiting for Player {current_player}'s turn...")
+
+        elif msg_get('type') == 'error':
+            error_msg = msg_get('message', 'Unknown error')
+            print(f"\nError: {error_msg}")
+            # input invalid number - only current player needs to retry
+            if msg_get('current_player') == player_num:
+                self._my_turn = True
+                print("Please try again.")
+                self._prompt_call()
+        return False
+
+    def _handle_call_input(self, text: str) -> None:    # validate one typed line and send the call
+        if text not in _VALID_CALLS:            # one set lookup covers junk and out-of-range alike
+            print("Invalid input! Please enter a number between 1-75.")
+            self._prompt_call()
+            return
+
+        self.send_message({                     # valid input, send to server
+            'type': 'call',
+            'number': int(text)
+        })
+        self._my_turn = False
+
     def play(self):
         if not self.connect():                              # connect to server
             return
@@ -97,142 +239,57 @@ class BingoClient:
         message = self.receive_message()                    # receive the bingo card
         if message and message.get('type') == 'card':
             self.card = message['numbers']
+            # one-time index so marking a called number is a dict lookup, not a 5x5 scan
+            self._pos = {self.card[r][c]: r * 5 + c for r in range(5) for c in range(5)}
             self.display_card()
         
         print("\nWaiting for game to start...")
         input("\nPress Enter(twice if you are not host) to start playing...")
         game_over = False
-        
-        while not game_over:
-            try:
-                message = self.receive_message()            # receive game state updates
-                if not message:
-                    print("\nConnection lost!")
-                    break
-                
-                if message.get('type') == 'game_state':
-                    current_player = message.get('current_player')
-                    last_called = message.get('last_called')
-                    self.called_numbers = message.get('called_numbers', [])
-                    if last_called:                         # mark the called number
-                        for row in range(5):
-                            for col in range(5):
-                                if self.card[row][col] == last_called:
-                                    self.marked[row][col] = True
-                        print(f"\n>>> Number {last_called} was called!")
-                    
-                    self.display_card()
-                    
-                    # Check if game is over (server determines winner)
-                    if message.get('game_over'):
-                        winner = message.get('winner')
-                        disconnected_player = message.get('disconnected_player')
-                        print("\n" + "="*50)
-                        if disconnected_player:
-                            print(f"       Player {disconnected_player} disconnected!")
-                            print("       Game ended.")
-                        elif winner == self.player_num:
-                            print("        BINGO! YOU WIN! ")
-                        else:
-                            print(f"       Game Over - Player {winner} wins!")
-                        print("="*50)
-                        game_over = True
-                        break
-                    
-                    if current_player == self.player_num:   # player's turn to call a number
-                        print(f"\n>>> YOUR TURN (Player {self.player_num})")
-                        
-                        # Keep asking until valid input is provided
-                        interrupted = False
-                        while True:
-                            try:
-                                print("Enter a number (1-75) to call: ", end="", flush=True)
-                                try:
-                                    user_input = input()
-                                except KeyboardInterrupt:
-                                    print("\n\nGame interrupted by user!")
-                                    interrupted = True
-                                    break
-                                
-                                try:
-                                    number = int(user_input)
-                                except ValueError:
-                                    print("Invalid input! Please enter a number.")
-                                    continue
-                                
-                                if number < 1 or number > 75:
-                                    print("Invalid number! Must be between 1-75")
-                                    continue  # Stay in input loop
-                                
-                                # Valid input, send to server
-                                self.send_message({
-                                    'type': 'call',
-                                    'number': number
-                                })
-                                break  # Exit input loop after sending
-                                
-                            except EOFError:
-                                print("\nInput closed, exiting...")
-                                interrupted = True
+
+        # Watch the socket and stdin together so a game-over or disconnect
+        # broadcast is handled immediately instead of waiting behind input()
+        sel = selectors.DefaultSelector()
+        sel.register(self.socket, selectors.EVENT_READ, 'net')
+        sel.register(sys.stdin, selectors.EVENT_READ, 'kbd')
+
+        # one SIGINT handler instead of try/except around every blocking call:
+        # shutdown() sends the FIN and unblocks select(), the flag ends the loop
+        prev_handler = signal.signal(signal.SIGINT, self._graceful_shutdown)
+        try:
+            while self._running and not game_over:
+                try:
+                    for key, _ in sel.select():
+                        if key.data == 'net':
+                            message = self.receive_message()    # receive game state updates
+                            if not message:
+                                if self._running:
+                                    print("\nConnection lost!")
+                                else:
+                                    print("\n\nGame interrupted!")
+                                game_over = None
                                 break
-                        
-                        if interrupted:
-                            game_over = True
-                            break
-                    else:
-                        print(f"\n>>> Waiting for Player {current_player}'s turn...")
-                
-                elif message.get('type') == 'error':
-                    error_msg = message.get('message', 'Unknown error')
-                    print(f"\nError: {error_msg}")
-                    # input invalid number - only current player needs to retry
-                    if message.get('current_player') == self.player_num:
-                        print("Please try again.")
-                        interrupted = False
-                        while True:
-                            try:
-                                print("Enter a number (1-75) to call: ", end="", flush=True)
-                                try:
-                                    user_input = input()
-                                except KeyboardInterrupt:
-                                    print("\n\nGame interrupted by user!")
-                                    interrupted = True
-                                    break
-                                
-                                try:
-                                    number = int(user_input)
-                                except ValueError:
-                                    print("Invalid input! Please enter a number.")
-                                    continue
-                                
-                                if number < 1 or number > 75:
-                                    print("Invalid number! Please enter a number between 1-75.")
-                                    continue
-                                self.send_message({
-                                    'type': 'call',
-                                    'number': number
-                                })
-                                break               # the number sent successfully, break the loop
-                                
-                            except EOFError:
+                            game_over = self._handle_message(message)
+                            if game_over:
+                                break
+                        else:                                   # a line is ready on stdin
+                            line = self._readline()
+                            if not line:
                                 print("\nInput closed, exiting...")
-                                interrupted = True
+                                game_over = True
                                 break
-                            except Exception as e:
-                                print(f"Error: {e}")
-                                continue
-                        
-                        if interrupted:
-                            game_over = True
-                            break
-            
-            except KeyboardInterrupt:
-                print("\n\nGame interrupted!")
-                break
-            except Exception as e:
-                print(f"\nError: {e}")
-                break
-        
+                            if self._my_turn:                   # ignore stray keystrokes off-turn
+                                self._handle_call_input(line.strip())
+                    if game_over is None:                       # connection lost, not a normal finish
+                        break
+
+                except Exception as e:
+                    print(f"\nError: {e}")
+                    game_over = None
+                    break
+        finally:
+            signal.signal(signal.SIGINT, prev_handler)
+            sel.close()
         if not game_over:
             print("\n" + "="*50)
             print("  Connection lost or game interrupted")
@@ -7,6 +7,10 @@ Messages:
 - Server -> Clients: {"type": "game_state", ...}
 - Client -> Server: {"type": "call", "number": <int>}
 """
+import array
+import bisect
+import queue
+import selectors
 import socket
 import threading
 import json
@@ -16,77 +20,105 @@ import struct
 from datetime import datetime
 import sys
 
+try:
+    import orjson                               # optional fast serializer, wire format stays JSON
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_dumps = orjson.dumps                   # returns bytes, ready for the wire
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    json_loads = json.loads
+
 DATABASE_SERVER_HOST = '140.113.17.11'
 DATABASE_SERVER_PORT = 17047
 
 LENGTH_LIMIT = 65536
 
+_HDR = struct.Struct('!I')                      # 4-byte length header, format parsed once
+
 ############## protocol part start ##############
 class ProtocolError(Exception):
     pass
 
 def send_message(sock: socket.socket, data: dict) -> None:
     try:
-        message = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        message = json_dumps(data)
         length = len(message)
         if length > LENGTH_LIMIT:
             raise ProtocolError(f"Message too large: {length} > {LENGTH_LIMIT}")
-        header = struct.pack('!I', length)
-        sock.sendall(header + message)
+        header = _HDR.pack(length)
+        if hasattr(sock, 'sendmsg'):            # scatter-gather, no user-space concatenation
+            sent = sock.sendmsg([header, message])
+            if sent < 4 + length:               # sendmsg may write partially, finish the rest
+                sock.sendall((header + message)[sent:])
+        else:
+            sock.sendall(header + message)
     except socket.error as e:
         raise ProtocolError(f"Socket error while sending: {e}")
 
 def recv_message(sock: socket.socket):
     try:
-        header = b''
-        while len(header) < 4:
-            chunk = sock.recv(4 - len(header))
-            if not chunk:
+        header = bytearray(4)
+        mv = memoryview(header)
+        got = 0
+        while got < 4:                          # fill in place, no per-chunk concatenation
+            n = sock.recv_into(mv[got:])
+            if not n:
                 return None
-            header += chunk
-        length = struct.unpack('!I', header)[0]
+            got += n
+        length = _HDR.unpack(header)[0]
         if length <= 0 or length > LENGTH_LIMIT:
             raise ProtocolError(f"Invalid message length: {length}")
-        message = b''
-        while len(message) < length:
-            chunk = sock.recv(length - len(message))
-            if not chunk:
+        message = bytearray(length)
+        mv = memoryview(message)
+        got = 0
+        while got < length:
+            n = sock.recv_into(mv[got:])
+            if not n:
                 return None
-            message += chunk
-        return json.loads(message.decode('utf-8'))
+            got += n
+        return json_loads(bytes(message))
     except Exception as e:
         raise ProtocolError(str(e))
 
 ################ protocol part end ##############
 
 class BingoGame:
+    # 12 winning lines (5 rows, 5 cols, 2 diagonals) as 25-bit masks, bit = row*5+col
+    LINES = ([sum(1 << (r * 5 + c) for c in range(5)) for r in range(5)] +
+             [sum(1 << (r * 5 + c) for r in range(5)) for c in range(5)] +
+             [sum(1 << (i * 5 + i) for i in range(5)),
+              sum(1 << (i * 5 + (4 - i)) for i in range(5))])
+
     def __init__(self):
         self.board_size = 5
         self.called_numbers = set()
-        
-    def generate_card(self):                        # generate a random bingo card
-        card = []
+        self.called_sorted = []                     # sorted mirror, one insort per call
+        self._rng = random.Random()                 # private generator, skips the module-level one
+
+    def add_called(self, number):                   # record a call in both structures
+        self.called_numbers.add(number)
+        bisect.insort(self.called_sorted, number)
+
+    def generate_card(self):                        # generate a random bingo card, flat 25-byte array
+        card = array.array('B', bytes(25))
         ranges = [(1, 15), (16, 30), (31, 45), (46, 60), (61, 75)]
-        
-        for col_range in ranges:                    # generate each column
-            column = random.sample(range(col_range[0], col_range[1] + 1), 5)
-            card.append(column)
-        
-        card = [[card[col][row] for col in range(5)] for row in range(5)]
-        # card[2][2] = 0
+
+        for col, col_range in enumerate(ranges):    # generate each column straight into place
+            column = self._rng.sample(range(col_range[0], col_range[1] + 1), 5)
+            for row in range(5):
+                card[row * 5 + col] = column[row]
+        # card[2 * 5 + 2] = 0
         return card
     
-    def check_winner(self, marked):                 # check if the marked positions have a winning pattern
-        for row in marked:                          # check rows
-            if all(row):
+    def check_winner(self, marked):                 # marked is a 25-bit bitboard, one AND per line
+        for line in self.LINES:
+            if marked & line == line:
                 return True
-        for col in range(self.board_size):          # check columns
-            if all(marked[row][col] for row in range(self.board_size)):
-                return True
-        if all(marked[i][i] for i in range(self.board_size)):       # check main diagonal
-            return True
-        if all(marked[i][self.board_size - 1 - i] for i in range(self.board_size)):       # check anti-diagonal
-            return True
         return False
 
 class GameServer:
@@ -110,7 +142,15 @@ class GameServer:
         self.marked = {}            # player_number -> marked positions
         self.game = BingoGame()
         self.current_player = 1
-        self.lock = threading.Lock()
+        # no lock: current_player / called_numbers / marked are only ever mutated
+        # by the game loop; writer threads just drain already-encoded frames
+        self._rxbuf = bytearray(4 + LENGTH_LIMIT)   # pooled receive buffer for the game loop
+        self.num_to_positions = {}  # number -> [(player, bit), ...], built when cards are dealt
+        self.lobby_sock = None      # persistent lobby connection, opened lazily
+        self.db_sock = None         # persistent database connection, opened lazily
+        self.tx_queues = {}         # socket -> bounded frame queue drained by a writer thread
+        self._snapshot_sent = False  # after the first full game_state, broadcasts are deltas
+        self._dropped = set()       # sockets that lost a frame and are owed a resync snapshot
 
     def start(self):
         self.running = True
@@ -118,6 +158,7 @@ class GameServer:
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.server_socket.bind(('', self.port))
         self.server_socket.listen(self.num_players)
+        self.server_socket.settimeout(1.0)      # wake periodically so shutdown is not stuck in accept()
 
         print(f"[GameServer] Listening on port {self.port} for {self.num_players} players...")
 
@@ -125,11 +166,20 @@ class GameServer:
             while len(self.sockets) < self.num_players and self.running:  # accept dynamic number of players
                 try:
                     client_sock, addr = self.server_socket.accept()
+                    client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)   # tiny turn frames, no Nagle
+                    client_sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                    try:
+                        client_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+                        client_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+                    except OSError:
+                        pass
                     print(f"[GameServer] Player {len(self.sockets)+1}/{self.num_players} connected from {addr}")
                     username = self.players[len(self.sockets)]
-                    
+
                     self.sockets.append(client_sock)
                     self.usernames.append(username)
+                except socket.timeout:
+                    continue
                 except KeyboardInterrupt:
                     raise
                 except Exception as e:
@@ -141,26 +191,35 @@ class GameServer:
                 self.close_all()
                 return
 
+            for sock in self.sockets:                               # one writer per socket, so a slow
+                q = queue.Queue(maxsize=16)                         # client never stalls the game loop
+                self.tx_queues[sock] = q
+                threading.Thread(target=self._writer_loop, args=(sock, q), daemon=True).start()
+
             for i in range(self.num_players):                       # map player numbers to sockets
-                self.player_map[i + 1] = self.sockets[i]                
+                self.player_map[i + 1] = self.sockets[i]
                 card = self.game.generate_card()                    # generate bingo card for each player
                 self.cards[i + 1] = card
-                
-                marked = [[False] * 5 for _ in range(5)]            # initialize marked positions (all False)
-                self.marked[i + 1] = marked
+                for idx in range(25):                               # index every cell once, so a call is O(N)
+                    self.num_to_positions.setdefault(card[idx], []).append((i + 1, 1 << idx))
+
+                self.marked[i + 1] = 0                              # marked positions as a 25-bit bitboard
 
-            for i in range(self.num_players):                       # send assignments and cards to players   
+            for i in range(self.num_players):                       # send assignments and cards to players
                 player_num = i + 1
                 try:
-                    self._send(self.player_map[player_num], {       # send player assignment
+                    assign_frame = self._encode({                   # player assignment
                         "type": "assign",
                         "player": player_num,
                         "player_name": self.usernames[i]
                     })
-                    self._send(self.player_map[player_num], {       # send player card
+                    card = self.cards[player_num]
+                    card_frame = self._encode({                     # player card, reshaped 5x5 for the wire
                         "type": "card",
-                        "numbers": self.cards[player_num]
+                        "numbers": [list(card[r * 5:r * 5 + 5]) for r in range(5)]
                     })
+                    # both frames in one write: one syscall, one TCP segment
+                    self._queue_frame(self.player_map[player_num], assign_frame + card_frame)
                 except Exception as e:
                     print(f"[GameServer] Failed to send assignment: {e}")
 
@@ -173,36 +232,42 @@ class GameServer:
             print(f"[GameServer] Game starting! Player {self.current_player}'s turn.")
             self.broadcast_game_state(None)
 
+            sel = selectors.DefaultSelector()                       # watch every player, not just the
+            for pnum, player_sock in self.player_map.items():       # current one, so a disconnect is
+                sel.register(player_sock, selectors.EVENT_READ, pnum)   # seen mid-turn, not turns later
+
             while not game_over and self.running:                   # main game loop
                 current = self.current_player
                 current_socket = self.player_map[current]
+                disconnected = None
+                message = None
 
                 try:
-                    # Receive length prefix (4 bytes)
-                    header = current_socket.recv(4)
-                    if not header or len(header) < 4:
-                        print(f"[GameServer] Player {current} disconnected")
-                        # Notify all players that game ended due to disconnection
-                        self.broadcast_game_state(None, winner='disconnected', disconnected_player=current)
+                    for key, _ in sel.select(timeout=1.0):
+                        pnum = key.data
+                        if pnum != current:                         # off-turn readability: data or hangup
+                            try:
+                                peek = key.fileobj.recv(1, socket.MSG_PEEK)
+                            except OSError:
+                                peek = b''
+                            if not peek:
+                                disconnected = pnum
+                                break
+                            self._read_frame(key.fileobj)           # drain and ignore off-turn frames
+                            continue
+                        message = self._read_frame(current_socket)
+                        if message is None:
+                            disconnected = current
                         break
-                    
-                    length = int.from_bytes(header, 'big')
-                    # Receive the actual payload
-                    raw_data = b''
-                    while len(raw_data) < length:
-                        chunk = current_socket.recv(min(4096, length - len(raw_data)))
-                        if not chunk:
-                            break
-                        raw_data += chunk
-                    
-                    if len(raw_data) < length:
-                        print(f"[GameServer] Player {current} disconnected")
+
+                    if disconnected is not None:
+                        print(f"[GameServer] Player {disconnected} disconnected")
                         # Notify all players that game ended due to disconnection
-                        self.broadcast_game_state(None, winner='disconnected', disconnected_player=current)
+                        self.broadcast_game_state(None, winner='disconnected', disconnected_player=disconnected)
                         break
+                    if message is None:                             # select timed out, poll again
+                        continue
 
-                    message = json.loads(raw_data.decode('utf-8'))
-                    
                     if message.get('type') == 'call':
                         number = message.get('number')
                         
@@ -222,15 +287,11 @@ class GameServer:
                             })
                             continue
                         
-                        self.game.called_numbers.add(number)            # record called number
+                        self.game.add_called(number)                    # record called number
                         print(f"[GameServer] Player {current} called number {number}")
                         
-                        for player_num in range(1, self.num_players + 1):  # mark number on all players' cards
-                            card = self.cards[player_num]
-                            for row in range(5):
-                                for col in range(5):
-                                    if card[row][col] == number:
-                                        self.marked[player_num][row][col] = True
+                        for player_num, bit in self.num_to_positions.get(number, ()):
+                            self.marked[player_num] |= bit          # mark number on all players' cards
                         
                         winner_found = None                             # check for winner
                         for player_num in range(1, self.num_players + 1):
@@ -251,6 +312,7 @@ class GameServer:
                     print(f"[GameServer] Error handling move: {e}")
                     break
 
+            sel.close()
             end_time = datetime.now().isoformat()                       # record end time
 
             try:
@@ -285,59 +347,159 @@ class GameServer:
         finally:
             self.close_all()
 
+    def _read_frame(self, sock):                # read one length-prefixed frame into the pooled buffer
+        mv = memoryview(self._rxbuf)
+        got = 0
+        while got < 4:                          # length prefix
+            n = sock.recv_into(mv[got:4])
+            if not n:
+                return None
+            got += n
+        length = _HDR.unpack_from(self._rxbuf)[0]
+        end = 4 + min(length, LENGTH_LIMIT)
+        while got < end:                        # payload fills the same buffer, no copies
+            n = sock.recv_into(mv[got:end])
+            if not n:
+                return None
+            got += n
+        return json_loads(bytes(mv[4:end]))
+
+    def _encode(self, data):                    # serialize once, reusable for every recipient
+        payload = json_dumps(data)
+        return _HDR.pack(len(payload)) + payload
+
+    def _writer_loop(self, sock, q):            # drain one socket's queue; None is the shutdown sentinel
+        while True:
+            frame = q.get()
+            if frame is None:
+                return
+            try:
+                sock.sendall(frame)
+            except Exception:
+                pass                            # keep draining so producers never block on a dead peer
+
+    def _queue_frame(self, sock, frame):        # enqueue a frame, dropping the oldest when full
+        q = self.tx_queues.get(sock)
+        if q is None:                           # no writer yet (handshake failures), send inline
+            try:
+                sock.sendall(frame)
+            except Exception as e:
+                print(f"[GameServer] Send error: {e}")
+            return
+        while True:
+            try:
+                q.put_nowait(frame)
+                return
+            except queue.Full:                  # drop the oldest frame; deltas are not idempotent,
+                self._dropped.add(sock)         # so this socket gets a full snapshot next broadcast
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+
     def _send(self, sock, data):
         try:
-            payload = json.dumps(data).encode('utf-8')
-            length = len(payload)
-            header = length.to_bytes(4, 'big')
-            sock.sendall(header + payload)
+            self._queue_frame(sock, self._encode(data))
         except Exception as e:
             print(f"[GameServer] Send error: {e}")
 
     def broadcast_game_state(self, last_called, winner=None, disconnected_player=None):
-        state = {
+        game_over = winner is not None or disconnected_player is not None
+        snapshot = {                            # full state: first broadcast, and resync after a drop
             'type': 'game_state',
             'current_player': self.current_player,
             'last_called': last_called,
-            'called_numbers': sorted(list(self.game.called_numbers)),
-            'game_over': winner is not None or disconnected_player is not None,
+            'called_numbers': self.game.called_sorted,  # maintained sorted, no per-broadcast sort
+            'game_over': game_over,
             'winner': winner if winner != 'disconnected' else None,
             'disconnected_player': disconnected_player
         }
+        if self._snapshot_sent:
+            delta_frame = self._encode({        # per-turn delta: clients track called numbers themselves
+                'type': 'delta',
+                'current_player': self.current_player,
+                'last_called': last_called,
+                'game_over': game_over,
+                'winner': winner if winner != 'disconnected' else None,
+                'disconnected_player': disconnected_player
+            })
+        else:
+            delta_frame = None
+            self._snapshot_sent = True
+        snapshot_frame = None                   # encoded lazily, most broadcasts never need it
         for sock in self.sockets:
             try:
-                self._send(sock, state)
+                if delta_frame is None or sock in self._dropped:
+                    if snapshot_frame is None:
+                        snapshot_frame = self._encode(snapshot)
+                    self._dropped.discard(sock)     # _queue_frame re-marks if this drops again
+                    self._queue_frame(sock, snapshot_frame)
+                else:
+                    self._queue_frame(sock, delta_frame)
             except Exception:
                 pass
 
+    @staticmethod
+    def _open_conn(host, port):                 # keepalive + NODELAY so the link survives idle gaps
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        s.connect((host, int(port)))
+        return s
+
     def notify_lobby(self, payload):
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((self.lobby_host, int(self.lobby_port)))
-            send_message(s, {"command": "game_ended", **payload})  # Use LPFP protocol
-            s.close()
-        except Exception as e:
-            print(f"[GameServer] Could not notify lobby: {e}")
+        message = {"command": "game_ended", **payload}  # Use LPFP protocol
+        for attempt in range(2):                # retry once with a fresh socket if the cached one died
+            try:
+                if self.lobby_sock is None:
+                    self.lobby_sock = self._open_conn(self.lobby_host, self.lobby_port)
+                send_message(self.lobby_sock, message)
+                return
+            except Exception as e:
+                try:
+                    if self.lobby_sock:
+                        self.lobby_sock.close()
+                except Exception:
+                    pass
+                self.lobby_sock = None
+                if attempt:
+                    print(f"[GameServer] Could not notify lobby: {e}")
 
     def write_game_log_to_db(self, payload):
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((DATABASE_SERVER_HOST, int(DATABASE_SERVER_PORT)))
-            send_message(s, {
-                'collection': 'GameLog',
-                'action': 'create',
-                'data': payload
-            })
+        for attempt in range(2):                # same reuse-with-one-retry policy as notify_lobby
             try:
-                response = recv_message(s)
-            except Exception:
-                response = None
-            s.close()
-        except Exception as e:
-            print(f"[GameServer] DB write error: {e}")
+                if self.db_sock is None:
+                    self.db_sock = self._open_conn(DATABASE_SERVER_HOST, DATABASE_SERVER_PORT)
+                send_message(self.db_sock, {
+                    'collection': 'GameLog',
+                    'action': 'create',
+                    'data': payload
+                })
+                try:
+                    response = recv_message(self.db_sock)
+                except Exception:
+                    response = None
+                return
+            except Exception as e:
+                try:
+                    if self.db_sock:
+                        self.db_sock.close()
+                except Exception:
+                    pass
+                self.db_sock = None
+                if attempt:
+                    print(f"[GameServer] DB write error: {e}")
 
     def close_all(self):                        # close all sockets and clean up
         self.running = False
+        deadline = time.time() + 2.0
+        for q in self.tx_queues.values():       # bounded flush so final frames get out, then stop writers
+            while not q.empty() and time.time() < deadline:
+                time.sleep(0.01)
+            try:
+                q.put_nowait(None)
+            except queue.Full:
+                pass
         for sock in self.sockets:
             try:
                 sock.close()
@@ -348,6 +510,12 @@ class GameServer:
                 self.server_socket.close()
             except:
                 pass
+        for sock in (self.lobby_sock, self.db_sock):
+            if sock:
+                try:
+                    sock.close()
+                except:
+                    pass
 
 def main():
     '''Usage: python3 bingo_server.py <port> <room_id> <game_id> <game_name> <game_version> <player1> <player2> <player3> [<player4> <player5>]'''
@@ -12,23 +12,43 @@ import random
 import math
 from typing import Dict, Optional, Any
 
+try:
+    import orjson                           # optional, much faster; wire format stays JSON
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_dumps = orjson.dumps               # returns bytes, ready for the wire
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    json_loads = json.loads
+
 ###### protocol part start ######
 # Length-Prefixed Framing Protocol
 LENGTH_LIMIT = 65536
 
+_HDR = struct.Struct('!I')                  # 4-byte length header, format parsed once
+
 class ProtocolError(Exception):             # the protocol error occurs
     pass
 
 def send_message(sock: socket.socket, data: Dict[Any, Any]) -> None:
     # send the message and follow the LPFP protocol
     try:
-        message = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        message = json_dumps(data)
         length = len(message)
         
         if length > LENGTH_LIMIT:               # the message is too large
             raise ProtocolError(f"Message too large: {length} > {LENGTH_LIMIT}")
-        header = struct.pack('!I', length)      # turn the header into 4 bytes
-        sock.sendall(header + message)
+        header = _HDR.pack(length)              # turn the header into 4 bytes
+        if hasattr(sock, 'sendmsg'):            # scatter-gather, no user-space concatenation
+            sent = sock.sendmsg([header, message])
+            if sent < 4 + length:               # sendmsg may write partially, finish the rest
+                sock.sendall((header + message)[sent:])
+        else:
+            sock.sendall(header + message)
 
     except socket.error as error:
         raise ProtocolError(f"Socket error while sending: {error}")
@@ -48,7 +68,7 @@ def recv_message(sock: socket.socket) -> Optional[Dict[Any, Any]]:
         if not header:                  # connection closed
             return None
         
-        length = struct.unpack('!I', header)[0]
+        length = _HDR.unpack(header)[0]
         if length <= 0 or length > LENGTH_LIMIT:
             raise ProtocolError(f"Invalid message length: {length}")
         
@@ -62,7 +82,7 @@ def recv_message(sock: socket.socket) -> Optional[Dict[Any, Any]]:
         if not message:
             raise ProtocolError("Connection closed while reading message body")
         
-        data = json.loads(message.decode('utf-8'))
+        data = json_loads(bytes(message))
         return data
     
     except socket.error as error:
@@ -74,6 +94,8 @@ def recv_message(sock: socket.socket) -> Optional[Dict[Any, Any]]:
 ###### protocol part end ######
 
 def display_board(board):               # display the connect four board
+    if isinstance(board, str):          # compact wire form: 42 row-major digits
+        board = [[int(ch) for ch in board[r * 7:(r + 1) * 7]] for r in range(6)]
     print("-----------------")
     for row in board:
         print("|", end=" ")
@@ -101,38 +123,60 @@ class ConnectFourClient:
         self.last_state = None
         self.first_board = True     # Flag to track first board display
         self.waiting_for_input = False  # Flag to track if waiting for player input
+        self._start_pending = False     # next stdin line means "start playing"
+        self._started = threading.Event()
 
     def connect(self):              # connect to game server
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)     # tiny move frames, no Nagle
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        try:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        except OSError:
+            pass
         self.sock.connect((self.host, self.port))
-        self.sock.sendall(json.dumps({'username': self.username}).encode())     
+        send_message(self.sock, {'username': self.username})    # LPFP-framed join
         self.running = True
+        # stdin lives on its own thread so the socket stays drained during think-time
+        threading.Thread(target=self._stdin_loop, daemon=True).start()
 
     def run(self):
-        buffer = ''
+        rxbuf = bytearray(4 + LENGTH_LIMIT)     # pooled frame buffer, reused for every message
+        mv = memoryview(rxbuf)
         try:
             while self.running:
-                raw = self.sock.recv(8192)
-                if not raw:
+                got = 0
+                while got < 4:                  # read the 4-byte length prefix
+                    n = self.sock.recv_into(mv[got:4])
+                    if not n:
+                        break
+                    got += n
+                if got < 4:
                     print("Server closed the connection")
                     break
-                buffer += raw.decode('utf-8', errors='ignore')              # accumulate received data
-                while buffer:                         # process all complete messages in buffer
-                    buffer = buffer.lstrip()
-                    if not buffer:
-                        break
-                    try:                                # try to decode a complete JSON message
-                        decoder = json.JSONDecoder()
-                        message, idx = decoder.raw_decode(buffer)
-                        buffer = buffer[idx:]           # Remove parsed message from buffer
-                    except json.JSONDecodeError:
+
+                length = _HDR.unpack_from(rxbuf)[0]
+                if length <= 0 or length > LENGTH_LIMIT:
+                    print(f"Invalid message length: {length}")
+                    break
+
+                end = 4 + length
+                while got < end:                # read exactly the frame body, no scanning parser
+                    n = self.sock.recv_into(mv[got:end])
+                    if not n:
                         break
-                    
-                    try:
-                        self.process_message(message)
-                    except Exception as e:
-                        print(f"Error processing message: {e}")
-                        continue
+                    got += n
+                if got < end:
+                    print("Server closed the connection")
+                    break
+
+                message = json_loads(bytes(mv[4:end]))
+                try:
+                    self.process_message(message)
+                except Exception as e:
+                    print(f"Error processing message: {e}")
+                    continue
         except KeyboardInterrupt:
             print('\nInterrupted, exiting')
         finally:
@@ -141,32 +185,53 @@ class ConnectFourClient:
             except Exception:
                 pass
     
-    def request_move(self):                            # request player move input
-        while self.waiting_for_input:
-            if self.player_no == 1:
-                print(">>> YOUR TURN (Player 1 - X)")
-            else:
-                print(">>> YOUR TURN (Player 2 - O)")
-            try:
-                raw_in = input("Your move (column 0-6): ").strip()
-            except (KeyboardInterrupt, EOFError):
+    def _stdin_loop(self):                             # reader thread: owns stdin for the whole match
+        while True:
+            line = sys.stdin.readline()
+            if not line:                               # stdin closed, shut the match down
                 print("\n\nGame interrupted, exiting...")
                 self.running = False
                 self.waiting_for_input = False
+                self._started.set()
+                try:
+                    self.sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
                 return
-            if raw_in == '':
-                continue
-            try:
-                c = int(raw_in)                         # validate input
-                if c < 0 or c > 6:                      # Check if number is in valid range (0-6)
-                    print("Invalid number! Please enter a number between 0-6")
-                    continue
-            except ValueError:
-                print("Invalid input! Please enter a number between 0-6")
+            if self._start_pending:                    # "press Enter to start"
+                self._start_pending = False
+                self._started.set()
                 continue
-            self.sock.sendall(json.dumps({'type': 'move', 'column': c}).encode())       # send move to server
-            self.waiting_for_input = False              # clear flag after sending move
-            break
+            if self.waiting_for_input:
+                self._try_send_move(line.strip())
+
+    def _prompt_move(self):
+        print("Your move (column 0-6): ", end="", flush=True)
+
+    def _try_send_move(self, text):                    # validate one typed line and send the move
+        if text == '':
+            self._prompt_move()
+            return
+        try:
+            c = int(text)                              # validate input
+            if c < 0 or c > 6:                         # Check if number is in valid range (0-6)
+                print("Invalid number! Please enter a number between 0-6")
+                self._prompt_move()
+                return
+        except ValueError:
+            print("Invalid input! Please enter a number between 0-6")
+            self._prompt_move()
+            return
+        # binary move fast path: 2-byte payload (tag 0x01 + column), no JSON for the hot message
+        self.sock.sendall(_HDR.pack(2) + bytes((1, c)))
+        self.waiting_for_input = False                 # clear flag after sending move
+
+    def request_move(self):                            # prompt; the stdin thread sends the move
+        if self.player_no == 1:
+            print(">>> YOUR TURN (Player 1 - X)")
+        else:
+            print(">>> YOUR TURN (Player 2 - O)")
+        self._prompt_move()
     
     def process_message(self, message):                # process a received message  
 
@@ -178,11 +243,10 @@ class ConnectFourClient:
             self.last_state = message            
             if self.first_board:                        # wait for user to start playing
                 self.first_board = False
-                try:
-                    input("\nPress Enter(twice if you are not host) to start playing...")
-                except (KeyboardInterrupt, EOFError):
-                    print("\n\nGame interrupted, exiting...")
-                    self.running = False
+                self._start_pending = True
+                print("\nPress Enter(twice if you are not host) to start playing...")
+                self._started.wait()                    # stdin thread signals when Enter arrives
+                if not self.running:
                     return
                 print()
             
@@ -3,10 +3,13 @@
 Messages:
 - Client -> Server: {"username": "..."} (on connect)
 - Client -> Server: {"type": "move", "column": <int>} (player move)
+- Client -> Server: 2-byte binary move frame: tag 0x01 + column (fast path)
 - Server -> Clients: {"type": "assign", "player": 1|2}
-- Server -> Clients: {"type": "game_state", "board": [...], "current_player": 1|2, "game_over": bool, "winner": None|1|2|-1}
+- Server -> Clients: {"type": "game_state", "board": "<42 row-major digits>", "current_player": 1|2, "game_over": bool, "winner": None|1|2|-1}
 """
+import queue
 import socket
+import selectors
 import threading
 import json
 import time
@@ -14,24 +17,45 @@ import random
 import struct
 from datetime import datetime
 import os
+import sys
 
 DATABASE_SERVER_HOST = '140.113.17.11'
 DATABASE_SERVER_PORT = 17047
 
 LENGTH_LIMIT = 65536
 
+try:
+    import orjson                           # optional, much faster; wire format stays JSON
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    json_dumps = orjson.dumps               # returns bytes, ready for the wire
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    json_loads = json.loads
+
 ############## protocol part start ##############
+_HDR = struct.Struct('!I')                  # 4-byte length header, format parsed once
+
 class ProtocolError(Exception):
     pass
 
 def send_message(sock: socket.socket, data: dict) -> None:
     try:
-        message = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        message = json_dumps(data)
         length = len(message)
         if length > LENGTH_LIMIT:
             raise ProtocolError(f"Message too large: {length} > {LENGTH_LIMIT}")
-        header = struct.pack('!I', length)
-        sock.sendall(header + message)
+        header = _HDR.pack(length)
+        if hasattr(sock, 'sendmsg'):            # scatter-gather, no user-space concatenation
+            sent = sock.sendmsg([header, message])
+            if sent < 4 + length:               # sendmsg may write partially, finish the rest
+                sock.sendall((header + message)[sent:])
+        else:
+            sock.sendall(header + message)
     except socket.error as e:
         raise ProtocolError(f"Socket error while sending: {e}")
 
@@ -43,7 +67,7 @@ def recv_message(sock: socket.socket):
             if not chunk:
                 return None
             header += chunk
-        length = struct.unpack('!I', header)[0]
+        length = _HDR.unpack(header)[0]
         if length <= 0 or length > LENGTH_LIMIT:
             raise ProtocolError(f"Invalid message length: {length}")
         message = b''
@@ -52,112 +76,122 @@ def recv_message(sock: socket.socket):
             if not chunk:
                 return None
             message += chunk
-        return json.loads(message.decode('utf-8'))
+        return json_loads(message)
     except Exception as e:
         raise ProtocolError(str(e))
 
 ############### protocol part end ##############
 
+# the initial game state has a fixed schema (empty board, player 1 to move),
+# so its frame is identical for every match and can be built at import time
+_EMPTY_STATE = json_dumps({
+    'type': 'game_state',
+    'board': '0' * 42,
+    'current_player': 1,
+    'game_over': False,
+    'winner': None
+})
+_EMPTY_STATE_FRAME = _HDR.pack(len(_EMPTY_STATE)) + _EMPTY_STATE
+
+_notify_q = queue.Queue()           # game-end payloads, drained off the game thread
+_notify_thread = None
+
+def _notify_drain():                # single background sender, reuses the server's cached socket
+    while True:
+        server, payload = _notify_q.get()
+        try:
+            server.notify_lobby(payload)
+        except Exception as e:
+            print(f"[GameServer] Background notify failed: {e}")
+        finally:
+            _notify_q.task_done()
+
+def queue_lobby_notify(server, payload):    # enqueue and return, the game thread never waits on the lobby
+    global _notify_thread
+    if _notify_thread is None:
+        _notify_thread = threading.Thread(target=_notify_drain, daemon=True)
+        _notify_thread.start()
+    _notify_q.put((server, payload))
+
+
 class exconnectFour:                # game logic for connect four
+    FULL = sum(0x3F << (7 * c) for c in range(7))   #all 42 playable bits (6 per 7-bit column)
+
     def __init__(self):
         self.rows = 6               #6 rows
         self.columns = 7            #7 columns
-        self.board = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
+        self.bb = [0, 0]            #one bitboard per player, bit = col*7 + row, top bit of each column is a guard
+        self.heights = [5] * 7      #lowest empty row per column, -1 when the column is full
+        self._cells = bytearray(b'0' * 42)  #row-major digit string for the wire, one byte rewritten per move
         #self.current_player = random.choice([1, 2])   #randomly choose which player start first(1 for player A, 2 for player B)
         self.current_player = 1     #let player A start first
-        
+
     def reset(self):                #reset the board
-        self.board = [[0 for _ in range(self.columns)] for _ in range(self.rows)]
+        self.bb = [0, 0]
+        self.heights = [5] * 7
+        self._cells[:] = b'0' * 42
         self.current_player = 1     #let player A start first
 
-    def display_board(self):        #display the current board
-        print("-----------------")
+    def _cell(self, row, col):      #0 for empty, otherwise the owning player
+        bit = 1 << (col * 7 + row)
+        if self.bb[0] & bit:
+            return 1
+        if self.bb[1] & bit:
+            return 2
+        return 0
+
+    @property
+    def board(self):                #nested-list view for display, built on demand
+        return [[self._cell(row, col) for col in range(7)] for row in range(6)]
+
+    @property
+    def board_str(self):            #42-char compact form for the wire, no per-turn traversal
+        return self._cells.decode()
+
+    def display_board(self):        #debug aid: set CF_DEBUG=1 to print the board, one write per call
+        if not os.environ.get('CF_DEBUG'):
+            return
+        cells = self._cells
+        lines = ["-----------------"]
         for row in range(self.rows):
-            print("|", end=" ")
-            for col in range(self.columns):
-                if self.board[row][col] == 1:
-                    print("X", end=" ")     #player A
-                elif self.board[row][col] == 2:
-                    print("O", end=" ")     #player B
-                else:
-                    print(".", end=" ")     #empty cell
-            print("|")
-        print("-----------------")
-        print("  0 1 2 3 4 5 6")            #column indexes
+            # '.'/X/O indexed straight off the wire string: 0 empty, 1 player A, 2 player B
+            lines.append("| " + " ".join(".XO"[cells[row * 7 + col] - 48] for col in range(self.columns)) + " |")
+        lines.append("-----------------")
+        lines.append("  0 1 2 3 4 5 6")     #column indexes
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def check_move(self, choose):           #check whether the column is full or not
         if choose < 0 or choose >= self.columns:
             return False
-        return self.board[0][choose] == 0
+        return self.heights[choose] >= 0
 
     def put_piece(self, choose):            #put piece into board
         if not self.check_move(choose):
             return False
-        
-        for row in range(self.rows - 1, -1, -1):
-            if self.board[row][choose] == 0:
-                self.board[row][choose] = self.current_player
-                if self.current_player == 1:
-                    self.current_player = 2
-                else:
-                    self.current_player = 1
-                return True
-        return False
+
+        row = self.heights[choose]
+        bit = 1 << (choose * 7 + row)                   #lowest empty cell, no downward scan
+        self.bb[self.current_player - 1] |= bit
+        self._cells[row * 7 + choose] = 48 + self.current_player    #keep the wire string in sync, O(1)
+        self.heights[choose] -= 1
+        if self.current_player == 1:
+            self.current_player = 2
+        else:
+            self.current_player = 1
+        return True
 
     def check_state(self):                  #check whether the game is end
-        #horizontal - with wrap around
-        for row in range(self.rows):
-            for col in range(self.columns):
-                current = self.board[row][col]      #current block player
-                if current == 0:
-                    continue
-                check = True
-                for i in range(4):
-                    if self.board[row][(col + i) % self.columns] != current:
-                        check = False
-                        break
-                if check:
-                    return current         #return the winner
-        #vertical |
-        for row in range(self.rows - 3):
-            for col in range(self.columns):
-                if (self.board[row][col] != 0 and
-                    self.board[row][col] == self.board[row + 1][col] ==
-                    self.board[row + 2][col] == self.board[row + 3][col]):
-                    return self.board[row][col]         #return the winner
-        # \ with wrap around
-        for row in range(self.rows - 3):
-            for col in range(self.columns):
-                current = self.board[row][col]      #current block player
-                if current == 0:
-                    continue
-                check = True
-                for i in range(4):
-                    if self.board[row + i][(col + i) % self.columns] != current:
-                        check = False
-                        break
-                if check:
-                    return current         #return the winner
-        # / with wrap around
-        for row in range(3, self.rows):
-            for col in range(self.columns):
-                current = self.board[row][col]      #current block player
-                if current == 0:
-                    continue
-                check = True
-                for i in range(4):
-                    if self.board[row - i][(col + i) % self.columns] != current:
-                        check = False
-                        break
-                if check:
-                    return current         #return the winner
-        draw = True
-        for row in range(self.rows):
-            for col in range(self.columns):
-                if self.board[row][col] == 0:
-                    return 0            #continue
-        
-        return -1   #draw
+        # shift-and-AND over each bitboard: 1 vertical, 7 horizontal, 6 and 8 diagonals;
+        # the guard bit per column keeps lines from wrapping between columns
+        for player, b in ((1, self.bb[0]), (2, self.bb[1])):
+            for s in (1, 7, 6, 8):
+                m = b & (b >> s)
+                if m & (m >> (2 * s)):
+                    return player          #return the winner
+
+        if (self.bb[0] | self.bb[1]) == self.FULL:
+            return -1   #draw
+        return 0            #continue
 
 
 class GameServer:
@@ -177,6 +211,9 @@ class GameServer:
         self.sockets = []          # accepted player sockets
         self.usernames = []        # usernames reported by players
         self.player_map = {}       # player_number -> socket
+        self.lobby_sock = None     # persistent lobby connection, opened lazily
+        self.db_sock = None        # persistent database connection, opened lazily
+        self._rxbuf = bytearray(4 + LENGTH_LIMIT)   # pooled receive buffer, one per server
 
     def start(self):
         self.running = True
@@ -184,6 +221,7 @@ class GameServer:
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.server_socket.bind(('', self.port))
         self.server_socket.listen(2)
+        self.server_socket.settimeout(1.0)      # bounded accept wait so the loop honors self.running
 
         print(f"[GameServer] Listening on port {self.port} for two players...")
 
@@ -191,19 +229,27 @@ class GameServer:
             while len(self.sockets) < 2 and self.running:           # player connections
                 try:
                     client_sock, addr = self.server_socket.accept()
+                    client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)   # tiny move frames, no Nagle
+                    client_sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                    try:
+                        client_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+                        client_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+                    except OSError:
+                        pass
                     print(f"[GameServer] Player connected from {addr}")
                     try:
-                        raw = client_sock.recv(4096)
-                        if not raw:
+                        info = self._read_frame(client_sock)    # framed join message
+                        if info is None:
                             client_sock.close()
                             continue
-                        info = json.loads(raw.decode())
                         username = info.get('username', f'Player{len(self.sockets)+1}')
                     except Exception:
                         username = f'Player{len(self.sockets)+1}'
 
                     self.sockets.append(client_sock)
                     self.usernames.append(username)
+                except socket.timeout:
+                    continue
                 except KeyboardInterrupt:
                     raise
                 except Exception as e:
@@ -219,13 +265,6 @@ class GameServer:
             self.player_map[1] = self.sockets[0]
             self.player_map[2] = self.sockets[1]
 
-            # inform clients of their player number
-            try:
-                self._send(self.player_map[1], {"type": "assign", "player": 1, "player_name": self.usernames[0]})
-                self._send(self.player_map[2], {"type": "assign", "player": 2, "player_name": self.usernames[1]})
-            except Exception as e:
-                print(f"[GameServer] Failed to send assignment: {e}")
-
             # create game and run loop
             game = exconnectFour()
             start_time = datetime.now().isoformat()
@@ -233,22 +272,57 @@ class GameServer:
             match_id = random.randint(100000, 999999)           # random match ID
             game_over = False
 
-            # send initial state
-            self.broadcast_game_state(game, None)
+            # assignment and the initial game state go out as one write per
+            # client, so game start costs one segment instead of two
+            state_frame = _EMPTY_STATE_FRAME
+            for num in (1, 2):
+                assign_frame = self._encode({"type": "assign", "player": num, "player_name": self.usernames[num - 1]})
+                try:
+                    self.player_map[num].sendall(assign_frame + state_frame)
+                except Exception as e:
+                    print(f"[GameServer] Failed to send assignment: {e}")
+
+            # watch both sockets so a disconnect by the waiting player is
+            # seen immediately instead of after the current player's move
+            sel = selectors.DefaultSelector()
+            sel.register(self.player_map[1], selectors.EVENT_READ, 1)
+            sel.register(self.player_map[2], selectors.EVENT_READ, 2)
+            winner = None
+            disconnected = None
 
             while not game_over and self.running:
                 cur = game.current_player
                 cur_sock = self.player_map[cur]
+                data = None
 
-                try:
-                    raw = cur_sock.recv(4096)
-                    if not raw:
-                        print(f"[GameServer] Player {cur} disconnected")
-                        break
-                    data = json.loads(raw.decode())
-                except Exception as e:
-                    print(f"[GameServer] Error receiving from player {cur}: {e}")
+                for key, _ in sel.select(timeout=1.0):
+                    if key.fileobj is cur_sock:
+                        try:
+                            data = self._read_frame(cur_sock)   # framed move message
+                        except Exception as e:
+                            print(f"[GameServer] Error receiving from player {cur}: {e}")
+                            data = None
+                        if data is None:
+                            disconnected = cur
+                    else:
+                        pnum = key.data                     # off-turn socket is readable
+                        try:
+                            peek = key.fileobj.recv(1, socket.MSG_PEEK)
+                        except OSError:
+                            peek = b''
+                        if not peek:                        # EOF: the waiting player left
+                            disconnected = pnum
+                        else:
+                            try:
+                                self._read_frame(key.fileobj)   # drain a stray off-turn frame
+                            except Exception:
+                                disconnected = pnum
+
+                if disconnected is not None:
+                    print(f"[GameServer] Player {disconnected} disconnected")
                     break
+                if data is None:                            # select timed out, keep waiting
+                    continue
 
                 if data.get('type') == 'move':
                     col = data.get('column')
@@ -272,6 +346,7 @@ class GameServer:
                     # unknown message type: ignore
                     continue
 
+            sel.close()
             end_time = datetime.now().isoformat()
 
             # notify lobby and write to database that the game ended
@@ -297,7 +372,7 @@ class GameServer:
                     results_payload['results'].append(entry)
 
                 # notify lobby - lobby will write GameLog with complete game info
-                self.notify_lobby(results_payload)
+                queue_lobby_notify(self, results_payload)
 
             except Exception as e:
                 print(f"[GameServer] Failed to notify lobby or DB: {e}")
@@ -305,52 +380,102 @@ class GameServer:
         finally:
             self.close_all()
 
-    def _send(self, sock, obj):                         # send JSON object to socket
+    def _read_frame(self, sock):                        # read one length-prefixed frame into the pooled buffer
+        mv = memoryview(self._rxbuf)
+        got = 0
+        while got < 4:                                  # length prefix
+            n = sock.recv_into(mv[got:4])
+            if not n:
+                return None
+            got += n
+        length = _HDR.unpack_from(self._rxbuf)[0]
+        end = 4 + min(length, LENGTH_LIMIT)
+        while got < end:                                # payload fills the same buffer, no copies
+            n = sock.recv_into(mv[got:end])
+            if not n:
+                return None
+            got += n
+        # binary move fast path: JSON payloads always start with '{', so a
+        # 0x01 tag byte unambiguously marks the 2-byte move frame
+        if length == 2 and mv[4] == 0x01:
+            return {'type': 'move', 'column': mv[5]}
+        return json_loads(bytes(mv[4:end]))
+
+    def _encode(self, data):                            # one framed message as bytes, ready to coalesce
+        message = json_dumps(data)
+        return _HDR.pack(len(message)) + message
+
+    def _send(self, sock, obj):                         # send framed JSON object to socket
         try:
-            sock.sendall(json.dumps(obj).encode())
+            send_message(sock, obj)
         except Exception:
             pass
 
     def broadcast_game_state(self, game, winner):       # broadcast current game state to all players
         state = {
             'type': 'game_state',
-            'board': game.board,
+            'board': game.board_str,
             'current_player': game.current_player,
             'game_over': winner != 0 if winner is not None else False,
             'winner': winner if winner is not None and winner != 0 else ( -1 if winner == -1 else None )
         }
+        frame = self._encode(state)                     # encode once, send the same bytes to everyone
         for sock in self.sockets:
             try:
-                self._send(sock, state)
+                sock.sendall(frame)
             except Exception:
                 pass
 
+    @staticmethod
+    def _open_conn(host, port):                         # keepalive + NODELAY so the link survives idle gaps
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        s.connect((host, int(port)))
+        return s
+
     def notify_lobby(self, payload):                    # notify lobby that the game ended
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((self.lobby_host, int(self.lobby_port)))
-            send_message(s, {"command": "game_ended", **payload})  # Use LPFP protocol
-            s.close()
-        except Exception as e:
-            print(f"[GameServer] Could not notify lobby: {e}")
+        message = {"command": "game_ended", **payload}  # Use LPFP protocol
+        for attempt in range(2):            # retry once with a fresh socket if the cached one died
+            try:
+                if self.lobby_sock is None:
+                    self.lobby_sock = self._open_conn(self.lobby_host, self.lobby_port)
+                send_message(self.lobby_sock, message)
+                return
+            except Exception as e:
+                try:
+                    if self.lobby_sock:
+                        self.lobby_sock.close()
+                except Exception:
+                    pass
+                self.lobby_sock = None
+                if attempt:
+                    print(f"[GameServer] Could not notify lobby: {e}")
 
     def write_game_log_to_db(self, payload):            # write game log to database server
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((DATABASE_SERVER_HOST, int(DATABASE_SERVER_PORT)))
-            send_message(s, {
-                'collection': 'GameLog',
-                'action': 'create',
-                'data': payload
-            })
+        for attempt in range(2):            # same reuse-with-one-retry policy as notify_lobby
             try:
-                response = recv_message(s)                  # wait for response
-            except Exception:
-                response = None
-            s.close()
-            return response
-        except Exception as e:
-            raise
+                if self.db_sock is None:
+                    self.db_sock = self._open_conn(DATABASE_SERVER_HOST, DATABASE_SERVER_PORT)
+                send_message(self.db_sock, {
+                    'collection': 'GameLog',
+                    'action': 'create',
+                    'data': payload
+                })
+                try:
+                    response = recv_message(self.db_sock)   # wait for response
+                except Exception:
+                    response = None
+                return response
+            except Exception as e:
+                try:
+                    if self.db_sock:
+                        self.db_sock.close()
+                except Exception:
+                    pass
+                self.db_sock = None
+                if attempt:
+                    raise
 
     def close_all(self):                        # close all sockets and clean up
         try:
@@ -360,6 +485,15 @@ class GameServer:
                 except Exception:
                     pass
         finally:
+            deadline = time.time() + 5.0        # let the background notifier flush before sockets close
+            while _notify_q.unfinished_tasks and time.time() < deadline:
+                time.sleep(0.01)
+            for sock in (self.lobby_sock, self.db_sock):
+                if sock:
+                    try:
+                        sock.close()
+                    except Exception:
+                        pass
             if self.server_socket:
                 try:
                     self.server_socket.close()
@@ -5,11 +5,13 @@ import threading
 import json
 import hashlib
 import struct
+import zlib
 import time
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Set, Any
 import os
 import sys
+import shutil
 DATABASE_SERVER_HOST = '140.113.17.11'
 DATABASE_SERVER_PORT = 17047
 LOBBYSERVER_HOST = '140.113.17.11'
@@ -133,6 +135,71 @@ def recv_file(sock: socket.socket, save_path: str) -> bool:         # receive a
     except Exception as e:
         print(f"Error receiving file: {e}")
         return False
+
+def recv_file_body_compressed(sock: socket.socket, save_path: str, file_size: int) -> bool:
+    # receive a deflate-framed body: 4-byte compressed length, then the compressed bytes
+    try:
+        header = b''
+        while len(header) < 4:
+            chunk = sock.recv(4 - len(header))
+            if not chunk:
+                return False
+            header += chunk
+        csize = struct.unpack('!I', header)[0]
+        payload = b''
+        while len(payload) < csize:
+            chunk = sock.recv(csize - len(payload))
+            if not chunk:
+                return False
+            payload += chunk
+        data = zlib.decompress(payload)
+        if len(data) != file_size:
+            return False
+        with open(save_path, 'wb') as f:
+            f.write(data)
+        return True
+    except Exception as e:
+        print(f"Error receiving file: {e}")
+        return False
+
+def recv_large(sock: socket.socket, key: str) -> Optional[Dict[Any, Any]]:
+    # reassemble a list field that may arrive in batches (see the client's send_large)
+    msg = recv_message(sock)
+    if not msg or key not in msg or 'batch' not in msg:
+        return msg
+    items = list(msg[key])
+    while not msg.get('final'):
+        msg = recv_message(sock)
+        if not msg or key not in msg:
+            return None
+        items.extend(msg[key])
+    msg[key] = items
+    return msg
+
+def _sha256(path: str) -> str:                  # content hash used for the update-manifest diff
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):     # 3.11+, hashes in C and releases the GIL
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        h = hashlib.sha256()
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+        return h.hexdigest()
+
+def recv_file_body(sock: socket.socket, save_path: str, file_size: int) -> bool:
+    # receive a file body of known size, the metadata arrived once in the manifest
+    try:
+        received = 0
+        with open(save_path, 'wb') as f:
+            while received < file_size:
+                chunk = sock.recv(min(8192, file_size - received))
+                if not chunk:
+                    break
+                f.write(chunk)
+                received += len(chunk)
+        return received == file_size
+    except Exception as e:
+        print(f"Error receiving file: {e}")
+        return False
 ###### protocol part end ######
 
 ###### developer part start ######
@@ -362,17 +429,19 @@ class DeveloperServer:
             # send ready signal to client to start file transfer
             send_message(client_socket, {'status': 'ready', 'message': 'Ready to receive files'})
             
-            file_count = request.get('fileCount', 0)                        # receive game files
-            for i in range(file_count):
-                file_info = recv_message(client_socket)
-                if not file_info:
-                    return {'status': 'error', 'message': 'Failed to receive file info'}
-                
+            manifest_msg = recv_large(client_socket, 'manifest')            # one manifest, then back-to-back file bodies
+            if not manifest_msg or 'manifest' not in manifest_msg:
+                return {'status': 'error', 'message': 'Failed to receive file manifest'}
+
+            compressed = manifest_msg.get('compression') == 'zlib'
+            recv_body = recv_file_body_compressed if compressed else recv_file_body
+
+            for file_info in manifest_msg['manifest']:                      # receive game files
                 file_name = file_info['name']
                 file_path = os.path.join(game_dir, file_name)
                 os.makedirs(os.path.dirname(file_path), exist_ok=True)      # ensure directory exists
-                
-                if not recv_file(client_socket, file_path):
+
+                if not recv_body(client_socket, file_path, file_info['size']):
                     return {'status': 'error', 'message': f'Failed to receive file: {file_name}'}
             
             print(f"[DevServer] Game {game_id} uploaded successfully")
@@ -423,16 +492,12 @@ class DeveloperServer:
             if os.path.exists(version_dir):
                 return {'status': 'error', 'message': f"Version {new_version} already exists for this game"}
             
-            if old_version:                                     # delete old version files
+            old_version_dir = None                              # kept until the new version has landed
+            if old_version:
                 old_version_dir = os.path.join(GAMES_STORAGE_PATH, game_name_safe, old_version)
-                if os.path.exists(old_version_dir):
-                    import shutil
-                    try:
-                        shutil.rmtree(old_version_dir)
-                        print(f"[DevServer] Deleted old version {old_version} from {old_version_dir}")
-                    except Exception as e:
-                        print(f"[DevServer] Warning: Failed to delete old version: {e}")
-            
+                if not os.path.exists(old_version_dir):
+                    old_version_dir = None
+
             game_dir = version_dir                              # create new version directory
             os.makedirs(game_dir, exist_ok=True)
             
@@ -452,19 +517,45 @@ class DeveloperServer:
 
             send_message(client_socket, {'status': 'ready', 'message': 'Ready to receive files'})
             
-            file_count = request.get('fileCount', 0)            # receive updated game files
-            for i in range(file_count):
-                file_info = recv_message(client_socket)
-                if not file_info:
-                    return {'status': 'error', 'message': 'Failed to receive file info'}
-                
+            manifest_msg = recv_large(client_socket, 'manifest')    # one manifest, then back-to-back file bodies
+            if not manifest_msg or 'manifest' not in manifest_msg:
+                return {'status': 'error', 'message': 'Failed to receive file manifest'}
+
+            manifest = manifest_msg['manifest']
+            compressed = manifest_msg.get('compression') == 'zlib'
+            recv_body = recv_file_body_compressed if compressed else recv_file_body
+            need = []                                           # diff against the previous version by content hash
+            for file_info in manifest:
+                file_name = file_info['name']
+                digest = file_info.get('sha256')
+                old_path = os.path.join(old_version_dir, file_name) if old_version_dir else None
+                if digest and old_path and os.path.isfile(old_path) and _sha256(old_path) == digest:
+                    file_path = os.path.join(game_dir, file_name)       # unchanged, reuse the stored copy
+                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                    shutil.copy2(old_path, file_path)
+                else:
+                    need.append(file_name)
+
+            send_message(client_socket, {'status': 'need', 'need': need})
+            need_set = set(need)
+
+            for file_info in manifest:                          # receive only the changed files, in manifest order
                 file_name = file_info['name']
+                if file_name not in need_set:
+                    continue
                 file_path = os.path.join(game_dir, file_name)
                 os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                
-                if not recv_file(client_socket, file_path):     # not receive file
+
+                if not recv_body(client_socket, file_path, file_info['size']):
                     return {'status': 'error', 'message': f'Failed to receive file: {file_name}'}
-            
+
+            if old_version_dir:                                 # delete old version files
+                try:
+                    shutil.rmtree(old_version_dir)
+                    print(f"[DevServer] Deleted old version {old_version} from {old_version_dir}")
+                except Exception as e:
+                    print(f"[DevServer] Warning: Failed to delete old version: {e}")
+
             print(f"[DevServer] Game {game_id} updated to version {new_version}")
             return {'status': 'success', 'message': 'Game updated successfully'}
             
@@ -508,7 +599,6 @@ class DeveloperServer:
             game_base_dir = os.path.join(GAMES_STORAGE_PATH, game_name_safe)
             
             if os.path.exists(game_base_dir):
-                import shutil
                 try:
                     shutil.rmtree(game_base_dir)
                     print(f"[DevServer] Deleted game files: {game_base_dir}")